@@ -3,7 +3,11 @@ from typing import List, Dict, Any
 from httpx import Response
 
 from src.http_requests import Requests, RequestInfo
-from src.schema import GdayBodyList
+from src.schema import GdayBodyAdapter
+
+# GET requests drop their body, so every /anything request is this same frozen
+# RequestInfo. Built once at import rather than once per body per call
+_ANYTHING_REQUEST = RequestInfo(method="GET", path="anything", params=None)
 
 
 class Anything:
@@ -11,6 +15,7 @@ class Anything:
 
     def __init__(self, requests: Requests):
         self.requests = requests.client_requests
+        self.arequests = requests.aclient_requests
 
     def get_anything(self, gday_body_list: List[Dict[str, Any]]) -> List[Response]:
         """GET request of /anything endpoint
@@ -37,11 +42,34 @@ class Anything:
         )
         ```
         """
+        return self.requests(requests=self._anything_request_info(gday_body_list))
+
+    async def aget_anything(
+        self, gday_body_list: List[Dict[str, Any]]
+    ) -> List[Response]:
+        """GET request of /anything endpoint from a running asyncio or trio loop
+
+        Same as get_anything but awaits the requests on the caller's loop.
+
+        Example Usage:
+
+        ```python
+        >>> async with client:
+        ...     responses = await client.aget_anything(
+        ...         [{"gday": {"mate": {"how": {"the": {"bloody": {"hell": ["are", "ya", 0]}}}}}}]
+        ...     )
+        ```
+        """
+        return await self.arequests(
+            requests=self._anything_request_info(gday_body_list)
+        )
+
+    @staticmethod
+    def _anything_request_info(
+        gday_body_list: List[Dict[str, Any]],
+    ) -> List[RequestInfo]:
+        """Validate the bodies and build one /anything request per body"""
         # Validate and do nothing if ok
-        GdayBodyList.model_validate(gday_body_list)
+        GdayBodyAdapter.validate_python(gday_body_list)
         # request
-        request_info = [
-            RequestInfo(method="GET", path="anything", params=None, body=body)
-            for body in gday_body_list
-        ]
-        return self.requests(requests=request_info)
+        return [_ANYTHING_REQUEST] * len(gday_body_list)
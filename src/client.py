@@ -22,6 +22,12 @@ class ApiClient(Anything):
         verify: bool = False,
         timeout: int = 15,
         raise_on_error: bool = True,
+        max_connections: int = 200,
+        max_keepalive_connections: int = 20,
+        concurrency: int = 200,
+        backend: str = "asyncio",
+        http2: bool = True,
+        http2_only: bool = False,
     ):
         """
         Initialize the ApiClient with the given configuration.
@@ -31,6 +37,15 @@ class ApiClient(Anything):
             verify (bool, optional): Whether to verify SSL certificates. Defaults to False.
             timeout (int, optional): The timeout for requests in seconds. Defaults to 15.
             raise_on_error (bool, optional): Whether to raise exceptions on HTTP errors. Defaults to True.
+            max_connections (int, optional): Size of the connection pool. Defaults to 200.
+            max_keepalive_connections (int, optional): Idle connections kept alive. Defaults to 20.
+            concurrency (int, optional): Maximum requests in flight at once. Defaults to 200.
+            backend (str, optional): Event loop for sync calls, "asyncio" (uvloop when
+                installed) or "trio". Defaults to "asyncio".
+            http2 (bool, optional): Negotiate HTTP/2 with servers that support it.
+                Defaults to True.
+            http2_only (bool, optional): Only speak HTTP/2 and size concurrency by its
+                streams rather than by connections. Defaults to False.
         """
         self.http_client = Requests(
             base_url=base_url,
@@ -38,15 +53,43 @@ class ApiClient(Anything):
             verify=verify,
             timeout=timeout,
             raise_on_error=raise_on_error,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            concurrency=concurrency,
+            backend=backend,
+            http2=http2,
+            http2_only=http2_only,
         )
 
         self.base_url = base_url
         self.verify = verify
         self.timeout = timeout
         self.raise_on_error = raise_on_error
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.concurrency = concurrency
+        self.backend = backend
+        self.http2 = http2
+        self.http2_only = http2_only
 
         super().__init__(self.http_client)
 
+    def __enter__(self) -> "ApiClient":
+        """Allow ApiClient with statements so the shared connection pool is closed"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Stop the background loop and close the shared AsyncClient on leaving the with block"""
+        self.http_client.close()
+
+    async def __aenter__(self) -> "ApiClient":
+        """Allow ApiClient async with statements for use with the a* methods"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the AsyncClient used by async requests on leaving the async with block"""
+        await self.http_client.aclose()
+
     def __repr__(self) -> str:
         """
         Return a string representation of the ApiClient instance.
@@ -57,5 +100,11 @@ class ApiClient(Anything):
         return (
             f"ApiClient(base_url={self.base_url}, "
             f"verify={self.verify}, timeout={self.timeout}, "
-            f"raise_on_error={self.raise_on_error})"
+            f"raise_on_error={self.raise_on_error}, "
+            f"max_connections={self.max_connections}, "
+            f"max_keepalive_connections={self.max_keepalive_connections}, "
+            f"concurrency={self.concurrency}, "
+            f"backend={self.backend}, "
+            f"http2={self.http2}, "
+            f"http2_only={self.http2_only})"
         )
@@ -0,0 +1,48 @@
+"""Errors raised for API responses outside of the 200 range.
+
+ApiError subclasses httpx.HTTPStatusError so callers already catching httpx errors
+keep working, and adds the parsed error body of the response.
+"""
+
+from typing import Any
+
+import orjson
+from httpx import HTTPStatusError, Response
+
+
+class ApiError(HTTPStatusError):
+    """An error response from the API with its body parsed as JSON if possible"""
+
+    def __init__(self, response: Response):
+        """
+        Initialize an ApiError from the failed response, building the message from it.
+
+        Args:
+            response (Response): The response with the error status code.
+        """
+        request = response.request
+        error = (
+            f"HTTP {response.status_code} {response.reason_phrase} "
+            f"for {request.method} {request.url}"
+        )
+        super().__init__(error, request=request, response=response)
+        self.status_code = response.status_code
+        self.errors = self.error_parse_json_or_utf8(response.content)
+
+    @staticmethod
+    def error_parse_json_or_utf8(content: bytes) -> Any:
+        """
+        Parse the response body once, falling back to text if it isn't JSON.
+
+        Args:
+            content (bytes): The raw response body.
+
+        Returns:
+            Any: The "errors" value of a JSON object body, any other JSON body as
+                parsed, or the body decoded as utf-8.
+        """
+        try:
+            parsed = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return content.decode("utf-8", errors="replace")
+        return parsed.get("errors", parsed) if isinstance(parsed, dict) else parsed
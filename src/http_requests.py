@@ -4,30 +4,85 @@ The purpose of this module is to abstract away the async runtime so that
 users don't need to run functions with asyncio.run() or trio.run().
 
 All requests are queued into a list of RequestInfo objects
-then handled in the trio.nursery.
-docs: https://trio.readthedocs.io/en/stable/reference-core.html#trio.Nursery
-example: https://trio.readthedocs.io/en/stable/reference-core.html#nurseries-and-spawning
+then handled in an anyio task group, the same async layer httpx is built on, so the
+batch runs under asyncio (with uvloop when installed) or trio.
+docs: https://anyio.readthedocs.io/en/stable/tasks.html
 
-From within the nursery, requests are called with make_request method. Each response is
-checked with "raise_for_status" and all future requests will crash with one bad API
-response. For any error outside of 200 range will be handled by the error module.
+From within the task group, requests are called with the _get_delete or _post_put_patch
+method, picked when the request is queued. Each response status is checked and all
+future requests will crash with one bad API response. Any status outside of the 200
+range is raised as src.errors.ApiError.
 
 This behaviour is optional with client instance arg "raise_on_error" default to True.
+
+Identical GET requests within a batch (same path and params) are sent once and their
+response object is shared by every matching position in the results. Other methods
+change server state, so repeats of them are always sent.
+
+Requests runs a single event loop in a background thread, started on the first call,
+so repeated client_requests calls skip the event loop startup and keep reusing the
+same AsyncClient. The loop is asyncio by default, Requests(backend="trio") keeps the
+trio runtime. Requests.close() stops the loop and releases the pool.
+
+Callers already inside an asyncio or trio loop should await Requests.aclient_requests
+instead, which runs the batch on the caller's loop with its own pooled AsyncClient.
 """
 
-from collections import namedtuple
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from importlib.util import find_spec
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
-import trio
+import anyio
+import orjson
+from anyio.abc import TaskGroup
+from anyio.from_thread import BlockingPortal
+from anyio.lowlevel import EventLoopToken, current_token
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from httpx import (
     AsyncClient,
+    Limits,
     Response,
 )
 
+from src.errors import ApiError
 
-class RequestInfo(namedtuple("RequestInfo", ["method", "path", "params", "body"])):
+
+_UNSUPPORTED = object()
+_JSON_HEADERS = {"Content-Type": "application/json"}
+# below this batch size hashing every request costs more than it could save
+_DEDUP_MIN_REQUESTS = 4
+# only safe methods are coalesced, a repeated POST is meant to be sent twice
+_DEDUP_METHODS = frozenset({"GET"})
+# tasks allowed to be spawned per limiter token, keeps the pending task count bounded
+_WINDOW_FACTOR = 4
+# streams per HTTP/2 connection, the RFC 9113 recommended minimum servers advertise
+_H2_MAX_CONCURRENT_STREAMS = 100
+# event loops the background thread can run batches on
+_BACKENDS = ("asyncio", "trio")
+# uvloop is optional, the background asyncio loop uses it when it is installed
+_HAS_UVLOOP = find_spec("uvloop") is not None
+
+
+@dataclass(frozen=True, slots=True, repr=False)
+class RequestInfo:
     """
-    A named tuple to represent request information.
+    A frozen dataclass to represent request information.
 
     Parameters:
     - method (str): The HTTP method (GET, POST, PUT, PATCH, DELETE).
@@ -35,25 +90,41 @@ class RequestInfo(namedtuple("RequestInfo", ["method", "path", "params", "body"]
     - params (Optional[Dict[str, Any]]): Query parameters for the request.
     - body (Any): Data to be sent in the request (for POST, PUT, and PATCH).
 
-    Using __slots__ improves memory efficiency and attribute access speed.
+    Computed on construction:
+    - content (Optional[bytes]): The body serialized to JSON with orjson so encoding
+      doesn't block the event loop mid batch.
+    - dedup_key (Optional[Hashable]): Identity used to coalesce identical GET
+      requests, None for other methods or when the params can't be serialized.
+
+    Using slots improves memory efficiency and attribute access speed.
     It restricts the creation of additional instance variables and enforces
     a strict attribute structure. This is helpful when making many async requests
     """
 
-    __slots__ = ()
+    method: str
+    path: str
+    params: Optional[Union[Dict[str, Any], str]] = None
+    body: Optional[Any] = None
+    content: Optional[bytes] = field(default=None, init=False, compare=False)
+    dedup_key: Optional[Hashable] = field(default=None, init=False, compare=False)
 
-    def __new__(
-        cls,
-        method: str,
-        path: str,
-        params: Optional[Union[Dict[str, Any], str]] = None,
-        body: Optional[Any] = None,
-    ):
+    def __post_init__(self):
         """RequestInfo dto for all methods"""
+        # normalise once here so the request loop can dispatch without re-casing
+        method = self.method.upper()
+        object.__setattr__(self, "method", method)
         # GET and DELETE REST API requests must not have body
-        if method.upper() in {"GET", "DELETE"}:
-            body = None
-        return super().__new__(cls, method, path, params, body)
+        if method in {"GET", "DELETE"}:
+            object.__setattr__(self, "body", None)
+        content = (
+            None
+            if self.body is None
+            else orjson.dumps(self.body, option=orjson.OPT_NON_STR_KEYS)
+        )
+        object.__setattr__(self, "content", content)
+        object.__setattr__(
+            self, "dedup_key", _dedup_key(method, self.path, self.params, content)
+        )
 
     def __repr__(self):
         return (
@@ -62,8 +133,68 @@ class RequestInfo(namedtuple("RequestInfo", ["method", "path", "params", "body"]
         )
 
 
+def _dedup_key(
+    method: str,
+    path: str,
+    params: Optional[Union[Dict[str, Any], str]],
+    content: Optional[bytes],
+) -> Optional[Hashable]:
+    """Hashable identity of a safe request, None if it must always be sent"""
+    if method not in _DEDUP_METHODS:
+        return None
+    params_key: Optional[Union[bytes, str]] = None
+    if isinstance(params, str):
+        params_key = params
+    elif params is not None:
+        try:
+            params_key = orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            return None
+    return (method, path, params_key, content)
+
+
+def _leaf_errors(group: BaseExceptionGroup) -> Iterator[BaseException]:
+    """Every exception in a possibly nested exception group, in order"""
+    for error in group.exceptions:
+        if isinstance(error, BaseExceptionGroup):
+            yield from _leaf_errors(error)
+        else:
+            yield error
+
+
+@contextmanager
+def _unwrap_single_error() -> Iterator[None]:
+    """Re-raise a task group's error bare so callers can catch ApiError directly
+
+    A lone error is raised as is. Requests failing on the same tick give a group of
+    ApiErrors, the first is raised. Any other mix is left as the exception group.
+    """
+    try:
+        yield
+    except BaseExceptionGroup as group:
+        errors = list(_leaf_errors(group))
+        if len(errors) == 1 or all(isinstance(error, ApiError) for error in errors):
+            raise errors[0]
+        raise
+
+
+def parse_json(response: Response) -> Any:
+    """
+    Decode a JSON response body with orjson.
+
+    A faster drop in for response.json() on large or deeply nested payloads.
+
+    Args:
+        response (Response): A response with a UTF-8 JSON body.
+
+    Returns:
+        Any: The decoded JSON.
+    """
+    return orjson.loads(response.content)
+
+
 class AsyncHandler:
-    """A class for making asynchronous HTTP requests using the Trio library."""
+    """A class for making asynchronous HTTP requests under asyncio or trio via anyio."""
 
     def __init__(
         self,
@@ -72,6 +203,11 @@ class AsyncHandler:
         timeout: int = 15,
         verify: bool = False,
         raise_on_error: Optional[bool] = True,
+        max_connections: int = 200,
+        max_keepalive_connections: int = 20,
+        concurrency: int = 200,
+        http2: bool = True,
+        http2_only: bool = False,
     ):
         """
         Initialize an AsyncHandler instance.
@@ -81,13 +217,38 @@ class AsyncHandler:
             headers (Dict[str, str]): The headers to include in each request.
             timeout (int, optional): The timeout for requests in seconds. Default 15.
             verify (bool, optional): Whether to verify SSL certificates. Defaults False.
+            max_connections (int, optional): Connection pool size. Defaults 200.
+            max_keepalive_connections (int, optional): Idle connections kept open
+                between requests. Defaults 20.
+            concurrency (int, optional): Requests in flight at once. Defaults 200.
+                Capped one below max_connections so a request holding a limiter
+                token never waits on an exhausted pool, unless http2_only is set.
+            http2 (bool, optional): Negotiate HTTP/2 when the server supports it,
+                multiplexing requests over fewer connections. Defaults True.
+            http2_only (bool, optional): Only speak HTTP/2, so concurrency is bound
+                by the streams of each connection rather than the connections.
+                For servers known to support it, h2 is only negotiated over TLS
+                with ALPN and any other server will fail. Defaults False.
         """
         self.base_url = base_url
         self.headers = headers
         self.timeout = timeout
         self.verify = verify
         self.raise_on_error = raise_on_error
-        self.responses: List[Response] = []
+        self.limits = Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self.concurrency = concurrency
+        self.http2 = http2 or http2_only
+        self.http2_only = http2_only
+        if http2_only:
+            # each connection carries many streams, bound by those not by connections
+            streams = max_connections * _H2_MAX_CONCURRENT_STREAMS
+            self.limit_tokens = max(1, min(concurrency, streams))
+        else:
+            # http2 may still fall back to HTTP/1.1, one request per connection
+            self.limit_tokens = max(1, min(concurrency, max_connections - 1))
 
     async def __aenter__(self):
         """boiler plate to allow AsyncHandler with statements using async context"""
@@ -96,84 +257,354 @@ class AsyncHandler:
     async def __aexit__(self, exc_type, exc_value, traceback):
         """boiler plate to allow AsyncHandler with statements using async context"""
 
-    async def make_request(
+    async def _get_delete(
         self,
+        limit: anyio.CapacityLimiter,
+        responses: List[Optional[Response]],
         https_method: Callable[..., Awaitable[Response]],
         path: str,
         params: Optional[Dict[str, Any]] = None,
-        body: Optional[Union[dict, str, bytes]] = None,
+        idx: int = 0,
+        window: Optional[anyio.Semaphore] = None,
     ) -> None:
         """
-        Make an asynchronous HTTPS request and add responses to class attribute list
+        Make a bodyless GET or DELETE request and store the response at its index
 
         Args:
+            limit (anyio.CapacityLimiter): Limiter shared by all requests in the batch.
+            responses (List[Optional[Response]]): The batch's pre-sized result list.
             https_method (Callable[..., Response]): The HTTP method
             path (str): The path for the request.
             params (Optional[Dict[str, Any]], optional): Query parameters for the
                 request. Defaults to None.
-            body (Optional[Union[dict, str, bytes]], optional): Request body data.
-                Defaults to None.
-        """
-        method_name = https_method.__name__
-        # Get and Delete requests have no body
-        if method_name in ("get", "delete"):
-            response = await https_method(path, params=params)
-        # all other methods have optional or mandatory body
-        else:
-            response = await https_method(path, params=params, json=body)
-        # fail on error if not 200 or similar OK response
-        if self.raise_on_error:
-            response.raise_for_status()
-        self.responses.append(response)
+            idx (int, optional): Position of the request in the batch. Defaults to 0.
+            window (Optional[anyio.Semaphore], optional): The batch's task window,
+                released once the request is done. Defaults to None.
+        """
+        try:
+            async with limit:
+                response = await https_method(path, params=params)
+            # fail on error if not 200 or similar OK response
+            if self.raise_on_error and not response.is_success:
+                raise ApiError(response)
+            responses[idx] = response
+        finally:
+            if window is not None:
+                window.release()
+
+    async def _post_put_patch(
+        self,
+        limit: anyio.CapacityLimiter,
+        responses: List[Optional[Response]],
+        https_method: Callable[..., Awaitable[Response]],
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        idx: int = 0,
+        window: Optional[anyio.Semaphore] = None,
+    ) -> None:
+        """
+        Make a POST, PUT or PATCH request and store the response at its index
 
-    async def send_requests(self, requests: List[RequestInfo]):
+        Args:
+            limit (anyio.CapacityLimiter): Limiter shared by all requests in the batch.
+            responses (List[Optional[Response]]): The batch's pre-sized result list.
+            https_method (Callable[..., Response]): The HTTP method
+            path (str): The path for the request.
+            params (Optional[Dict[str, Any]], optional): Query parameters for the
+                request. Defaults to None.
+            content (Optional[bytes], optional): Request body already serialized
+                to JSON. Defaults to None.
+            headers (Optional[Dict[str, str]], optional): Extra headers for the
+                request, the JSON Content-Type when the body is set. Defaults to None.
+            idx (int, optional): Position of the request in the batch. Defaults to 0.
+            window (Optional[anyio.Semaphore], optional): The batch's task window,
+                released once the request is done. Defaults to None.
+        """
+        try:
+            async with limit:
+                response = await https_method(
+                    path, params=params, content=content, headers=headers
+                )
+            # fail on error if not 200 or similar OK response
+            if self.raise_on_error and not response.is_success:
+                raise ApiError(response)
+            responses[idx] = response
+        finally:
+            if window is not None:
+                window.release()
+
+    async def send_requests(
+        self, requests: List[RequestInfo], client: Optional[AsyncClient] = None
+    ) -> List[Response]:
         """
         Send a list of asynchronous HTTP requests.
 
         Args:
             requests (List[RequestInfo]): A list of RequestInfo objects
             representing the requests to send.
+            client (Optional[AsyncClient], optional): A long lived client to send the
+                requests with so keep-alive connections are reused between calls.
+                Defaults to None which opens a client for this call only.
+
+        Returns:
+            List[Response]: Responses in the same order as the requests,
+                new for every call so a reused handler never returns stale results.
         """
-        async with AsyncClient(
-            base_url=self.base_url,
-            headers=self.headers,
-            verify=self.verify,
-            timeout=self.timeout,
-        ) as client:
-            async with trio.open_nursery() as nursery:
-                for request in requests:
-                    method = self.get_method_by_name(client, request.method)
-                    nursery.start_soon(
-                        self.make_request,
-                        method,
-                        request.path,
-                        request.params,
-                        request.body,
-                    )
-
-    def get_method_by_name(self, client: AsyncClient, method_name: str) -> Callable:
-        """
-        Get the appropriate HTTP method by name.
+        if client is None:
+            async with AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                verify=self.verify,
+                timeout=self.timeout,
+                limits=self.limits,
+                http1=not self.http2_only,
+                http2=self.http2,
+            ) as client:
+                return await self._send_all(client, requests)
+        return await self._send_all(client, requests)
+
+    async def _send_all(
+        self, client: AsyncClient, requests: List[RequestInfo]
+    ) -> List[Response]:
+        """Start every request in the task group using the given client"""
+        # pre-sized so responses line up with requests regardless of completion order
+        responses: List[Optional[Response]] = [None] * len(requests)
+        groups = self.group_duplicates(requests)
+        with _unwrap_single_error():
+            async with anyio.create_task_group() as task_group:
+                await self._start_requests(
+                    task_group, client, requests, groups, responses
+                )
+        # identical requests share the one response that was fetched
+        for idx, duplicates in groups.items():
+            for duplicate in duplicates:
+                responses[duplicate] = responses[idx]
+        # every slot is filled once the task group exits without raising
+        return cast(List[Response], responses)
+
+    @asynccontextmanager
+    async def iter_responses(
+        self, requests: List[RequestInfo], client: AsyncClient
+    ) -> AsyncIterator[MemoryObjectReceiveStream[Tuple[int, Response]]]:
+        """
+        Send a list of asynchronous HTTP requests, receiving responses as they complete.
+
+        Responses are not kept once received, so the consumer can process and close
+        each one without the whole batch being held in memory. A context manager
+        rather than an async generator because an async generator can't yield from
+        inside a task group. Leaving the block early cancels the requests in flight.
+
+        Args:
+            requests (List[RequestInfo]): A list of RequestInfo objects
+            representing the requests to send.
+            client (AsyncClient): The client to send the requests with.
+
+        Yields:
+            MemoryObjectReceiveStream: Iterate for (index, response) tuples, the index
+                being the position of the request in the batch.
+        """
+        responses: List[Optional[Response]] = [None] * len(requests)
+        groups = self.group_duplicates(requests)
+        # unbuffered so at most one completed response waits on the consumer per task
+        send_channel, receive_channel = anyio.create_memory_object_stream[
+            Tuple[int, Response]
+        ](0)
+        with _unwrap_single_error():
+            async with anyio.create_task_group() as task_group:
+                task_group.start_soon(
+                    self._stream_all, client, requests, groups, responses, send_channel
+                )
+                async with receive_channel:
+                    try:
+                        yield receive_channel
+                    finally:
+                        # cancel while the channel is open, or tasks blocked in
+                        # send would wake with BrokenResourceError instead
+                        task_group.cancel_scope.cancel()
+
+    async def _stream_all(
+        self,
+        client: AsyncClient,
+        requests: List[RequestInfo],
+        groups: Dict[int, List[int]],
+        responses: List[Optional[Response]],
+        send_channel: MemoryObjectSendStream[Tuple[int, Response]],
+    ) -> None:
+        """Start every request and close the channel once all have been sent on"""
+        async with send_channel:
+            async with anyio.create_task_group() as task_group:
+                await self._start_requests(
+                    task_group, client, requests, groups, responses, send_channel
+                )
+
+    async def _stream_one(
+        self,
+        window: anyio.Semaphore,
+        send_channel: MemoryObjectSendStream[Tuple[int, Response]],
+        responses: List[Optional[Response]],
+        duplicates: List[int],
+        idx: int,
+        helper: Callable[..., Coroutine[Any, Any, None]],
+        *args: Any,
+    ) -> None:
+        """Run a request helper then hand its response at idx to the stream consumer
+
+        The window slot is held until the consumer has taken the response, so a slow
+        consumer stops new requests from starting instead of piling up responses.
+        """
+        try:
+            await helper(*args)
+            # the helper returned without raising, so its slot is filled
+            response = cast(Response, responses[idx])
+            # drop the batch's reference so the consumer controls the response lifetime
+            responses[idx] = None
+            for position in (idx, *duplicates):
+                await send_channel.send((position, response))
+        finally:
+            window.release()
+
+    async def _start_requests(
+        self,
+        task_group: TaskGroup,
+        client: AsyncClient,
+        requests: List[RequestInfo],
+        groups: Dict[int, List[int]],
+        responses: List[Optional[Response]],
+        send_channel: Optional[MemoryObjectSendStream[Tuple[int, Response]]] = None,
+    ) -> None:
+        """Start one task per unique request, streaming to send_channel if given
+
+        Waits on the window before each start so at most _WINDOW_FACTOR tasks per
+        limiter token are ever pending, however large the batch.
+        """
+        # both per batch so concurrent batches on one handler never share slots
+        limit = anyio.CapacityLimiter(self.limit_tokens)
+        window = anyio.Semaphore(_WINDOW_FACTOR * self.limit_tokens)
+        dispatch = self.get_method_map(client)
+        # a Content-Type set on the client, e.g. merge-patch+json, wins over the default
+        json_headers = None if "content-type" in client.headers else _JSON_HEADERS
+        for idx, duplicates in groups.items():
+            request = requests[idx]
+            method = dispatch.get(request.method, _UNSUPPORTED)
+            if method is _UNSUPPORTED:
+                raise ValueError(
+                    f"Unsupported HTTP method {request.method!r}, "
+                    f"expected one of {', '.join(dispatch)}"
+                )
+            # a streamed slot is held until the consumer has the response, so there
+            # _stream_one releases the window rather than the helper
+            helper_window = window if send_channel is None else None
+            # Get and Delete requests have no body
+            if request.method in ("GET", "DELETE"):
+                helper: Callable[..., Coroutine[Any, Any, None]] = self._get_delete
+                args: Tuple[Any, ...] = (
+                    limit,
+                    responses,
+                    method,
+                    request.path,
+                    request.params,
+                    idx,
+                    helper_window,
+                )
+            # all other methods have optional or mandatory body
+            else:
+                helper = self._post_put_patch
+                args = (
+                    limit,
+                    responses,
+                    method,
+                    request.path,
+                    request.params,
+                    request.content,
+                    None if request.content is None else json_headers,
+                    idx,
+                    helper_window,
+                )
+            await window.acquire()
+            if send_channel is None:
+                # the helper frees its own window slot, one frame per request
+                task_group.start_soon(helper, *args)
+            else:
+                task_group.start_soon(
+                    self._stream_one,
+                    window,
+                    send_channel,
+                    responses,
+                    duplicates,
+                    idx,
+                    helper,
+                    *args,
+                )
+
+    @staticmethod
+    def group_duplicates(requests: List[RequestInfo]) -> Dict[int, List[int]]:
+        """
+        Group identical GET requests so each is only sent once per batch.
+
+        Requests match on method, path, params and serialized body. Other methods
+        are never grouped, nor are small batches.
+
+        Args:
+            requests (List[RequestInfo]): The batch of requests.
+
+        Returns:
+            Dict[int, List[int]]: Index of each request to send, mapped to the indices
+                of later requests identical to it.
+        """
+        if len(requests) < _DEDUP_MIN_REQUESTS:
+            return {idx: [] for idx in range(len(requests))}
+        groups: Dict[int, List[int]] = {}
+        first_seen: Dict[Hashable, int] = {}
+        for idx, request in enumerate(requests):
+            key = request.dedup_key
+            if key is None:
+                groups[idx] = []
+            elif key in first_seen:
+                groups[first_seen[key]].append(idx)
+            else:
+                first_seen[key] = idx
+                groups[idx] = []
+        return groups
+
+    def get_method_map(self, client: AsyncClient) -> Dict[str, Callable]:
+        """
+        Map upper case HTTP method names to the client's bound methods.
+
+        Built once per batch rather than once per request.
 
         Args:
             client (AsyncClient): The AsyncClient instance.
-            method_name (str): The HTTP method name.
 
         Returns:
-            Callable: The corresponding HTTP method.
+            Dict[str, Callable]: HTTP method name to corresponding client method.
         """
-        method_map: Dict[str, Callable] = {
+        return {
             "GET": client.get,
             "POST": client.post,
             "PUT": client.put,
             "PATCH": client.patch,
             "DELETE": client.delete,
         }
-        return method_map[method_name.upper()]
 
 
 class Requests:
-    """Async class for making https requests"""
+    """Async class for making https requests
+
+    A single AsyncClient is created lazily and reused across client_requests calls
+    so the connection pool (and its keep-alive sockets) outlives each batch.
+    Batches are submitted to an event loop running in a background thread, asyncio
+    (with uvloop when installed) unless backend="trio" is given. HTTP/2 is negotiated
+    with servers that support it so many requests share one connection, and
+    http2_only=True sizes concurrency by HTTP/2 streams for servers known to speak it.
+    Call close() when finished to stop the loop and release the pool.
+
+    Async callers use aclient_requests, which keeps a separate AsyncClient bound to
+    the caller's loop, rebuilt if a later call comes from another loop. Call aclose()
+    before each loop exits, a client left open can't be closed once its loop is gone
+    and its keep-alive sockets stay open until garbage collected.
+    """
 
     def __init__(
         self,
@@ -182,33 +613,249 @@ class Requests:
         verify: bool = False,
         timeout: int = 15,
         raise_on_error: bool = True,
+        max_connections: int = 200,
+        max_keepalive_connections: int = 20,
+        concurrency: int = 200,
+        backend: str = "asyncio",
+        http2: bool = True,
+        http2_only: bool = False,
     ):
+        if backend not in _BACKENDS:
+            raise ValueError(
+                f"Unsupported backend {backend!r}, expected one of {', '.join(_BACKENDS)}"
+            )
         self.base_url = base_url
         self.headers = headers
         self.verify = verify
         self.timeout = timeout
         self.raise_on_error = raise_on_error
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.concurrency = concurrency
+        self.backend = backend
+        self.http2 = http2 or http2_only
+        self.http2_only = http2_only
+        self._client: Optional[AsyncClient] = None
+        self._aclient: Optional[AsyncClient] = None
+        self._aclient_token: Optional[EventLoopToken] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._portal: Optional[BlockingPortal] = None
+        self._stop: Optional[anyio.Event] = None
+
+    def _build_client(self) -> AsyncClient:
+        """Construct an AsyncClient from this instance's configuration"""
+        return AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            verify=self.verify,
+            timeout=self.timeout,
+            limits=Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+            ),
+            http1=not self.http2_only,
+            http2=self.http2,
+        )
 
-    def client_requests(self, requests: List[RequestInfo]) -> List[Response]:
+    def _get_client(self) -> AsyncClient:
         """
-        This function sends one or more HTTP requests asynchronously using trio framework.
+        Get the shared AsyncClient of the background loop, constructing it on first use.
 
-        Args:
-            requests (Union[RequestInfo, List[RequestInfo]]): Single or list of requests.
+        Returns:
+            AsyncClient: The long lived client bound to this Requests instance.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = self._build_client()
+        return self._client
+
+    def _get_aclient(self) -> AsyncClient:
+        """
+        Get the AsyncClient used by aclient_requests, constructing it on first use.
+
+        Rebuilt when called from a different event loop than the one it was made on,
+        since its pooled connections belong to that loop.
 
         Returns:
-            Union[Response, List[Response]]: If a single request was sent, returns a single
-                response. If multiple requests were sent, returns a list of responses.
+            AsyncClient: The long lived client bound to the caller's loop.
         """
-        request_maker = AsyncHandler(
+        token = current_token()
+        if (
+            self._aclient is None
+            or self._aclient.is_closed
+            or self._aclient_token != token
+        ):
+            # a client left open by a finished loop can't be closed from this one
+            self._aclient = self._build_client()
+            self._aclient_token = token
+        return self._aclient
+
+    async def aclose(self) -> None:
+        """Close the AsyncClient used by aclient_requests if one was opened"""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+            self._aclient_token = None
+
+    def _backend_options(self) -> Dict[str, Any]:
+        """anyio.run options for the background loop"""
+        if self.backend == "asyncio" and _HAS_UVLOOP:
+            return {"use_uvloop": True}
+        return {}
+
+    async def _main(self, ready: threading.Event) -> None:
+        """Background loop entrypoint, parks until close() and then closes the client"""
+        self._stop = anyio.Event()
+        try:
+            async with BlockingPortal() as portal:
+                self._portal = portal
+                ready.set()
+                await self._stop.wait()
+        finally:
+            if self._client is not None:
+                await self._client.aclose()
+                self._client = None
+
+    def _run_loop(
+        self, ready: threading.Event, startup_error: List[BaseException]
+    ) -> None:
+        """Background thread target, handing a failed loop startup back to the caller"""
+        try:
+            anyio.run(
+                self._main,
+                ready,
+                backend=self.backend,
+                backend_options=self._backend_options(),
+            )
+        except BaseException as error:
+            if ready.is_set():
+                raise
+            startup_error.append(error)
+        finally:
+            # never leave _start_loop waiting on a loop that won't come up
+            ready.set()
+
+    def _start_loop(self) -> BlockingPortal:
+        """
+        Start the background event loop if it isn't already running.
+
+        Returns:
+            BlockingPortal: Portal used to submit work to the loop.
+
+        Raises:
+            BaseException: Whatever stopped the event loop from starting.
+        """
+        with self._loop_lock:
+            if self._loop_thread is None or not self._loop_thread.is_alive():
+                ready = threading.Event()
+                startup_error: List[BaseException] = []
+                self._loop_thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(ready, startup_error),
+                    name=f"requests-{self.backend}-loop",
+                    daemon=True,
+                )
+                self._loop_thread.start()
+                ready.wait()
+                if startup_error:
+                    self._loop_thread.join()
+                    self._loop_thread = None
+                    raise startup_error[0]
+            assert self._portal is not None
+            return self._portal
+
+    def close(self) -> None:
+        """Stop the background event loop and close the shared AsyncClient"""
+        with self._loop_lock:
+            if self._loop_thread is None:
+                return
+            if self._loop_thread.is_alive():
+                assert self._portal is not None and self._stop is not None
+                self._portal.call(self._stop.set)
+                self._loop_thread.join()
+            self._loop_thread = None
+            self._portal = None
+            self._stop = None
+
+    def _handler(self) -> AsyncHandler:
+        """AsyncHandler configured like this instance, one per batch"""
+        return AsyncHandler(
             base_url=self.base_url,
             headers=self.headers,
             verify=self.verify,
             timeout=self.timeout,
             raise_on_error=self.raise_on_error,
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            concurrency=self.concurrency,
+            http2=self.http2,
+            http2_only=self.http2_only,
         )
-        # all requests must be in a list
-        # run all requests async and append responses
-        trio.run(request_maker.send_requests, requests)
-        # responses lists from all requests
-        return request_maker.responses
+
+    async def _run(
+        self, requests: List[RequestInfo], client: Optional[AsyncClient] = None
+    ) -> List[Response]:
+        """Send the batch and return the ordered responses
+
+        Uses the background loop's shared client unless another client is given.
+        """
+        request_maker = self._handler()
+        # run all requests async on the shared client, responses ordered as requested
+        return await request_maker.send_requests(requests, client or self._get_client())
+
+    def client_requests(self, requests: List[RequestInfo]) -> List[Response]:
+        """
+        This function sends one or more HTTP requests asynchronously.
+
+        The batch runs on the background event loop and this call blocks until it is
+        done.
+
+        Args:
+            requests (List[RequestInfo]): All requests must be in a list.
+
+        Returns:
+            List[Response]: Responses in the same order as the requests.
+        """
+        portal = self._start_loop()
+        return portal.call(self._run, requests)
+
+    async def aclient_requests(self, requests: List[RequestInfo]) -> List[Response]:
+        """
+        Send one or more HTTP requests from an already running asyncio or trio loop.
+
+        The client is bound to the calling loop, await aclose() before that loop
+        exits so its connections are released, e.g. once per asyncio.run().
+
+        Args:
+            requests (List[RequestInfo]): All requests must be in a list.
+
+        Returns:
+            List[Response]: Responses in the same order as the requests.
+        """
+        return await self._run(requests, self._get_aclient())
+
+    @asynccontextmanager
+    async def astream_requests(
+        self, requests: List[RequestInfo]
+    ) -> AsyncIterator[MemoryObjectReceiveStream[Tuple[int, Response]]]:
+        """
+        Send one or more HTTP requests from an already running asyncio or trio loop,
+        receiving each response as soon as it completes.
+
+        ```python
+        >>> async with requests.astream_requests(request_info) as responses:
+        ...     async for idx, response in responses:
+        ...         response.close()
+        ```
+
+        Args:
+            requests (List[RequestInfo]): All requests must be in a list.
+
+        Yields:
+            MemoryObjectReceiveStream: Iterate for (index, response) tuples.
+        """
+        request_maker = self._handler()
+        async with request_maker.iter_responses(
+            requests, self._get_aclient()
+        ) as responses:
+            yield responses
@@ -1,19 +1,35 @@
-import json
-
+import orjson
 from loguru import logger
 
 from src.client import ApiClient
+from src.http_requests import parse_json
 
-client = ApiClient("https://httpbin.org/")
-
-responses = client.get_anything(
-    [
-        {"gday": {"mate": {"how": {"the": {"bloody": {"hell": ["are", "ya", 0]}}}}}},
-        {"gday": {"mate": {"how": {"the": {"bloody": {"hell": ["are", "ya", 1]}}}}}},
-        {"gday": {"mate": {"how": {"the": {"bloody": {"hell": ["are", "ya", 2]}}}}}},
-    ]
-)
+with ApiClient("https://httpbin.org/") as client:
+    responses = client.get_anything(
+        [
+            {
+                "gday": {
+                    "mate": {"how": {"the": {"bloody": {"hell": ["are", "ya", 0]}}}}
+                }
+            },
+            {
+                "gday": {
+                    "mate": {"how": {"the": {"bloody": {"hell": ["are", "ya", 1]}}}}
+                }
+            },
+            {
+                "gday": {
+                    "mate": {"how": {"the": {"bloody": {"hell": ["are", "ya", 2]}}}}
+                }
+            },
+        ]
+    )
 
 for response in responses:
-    tidy_json_str_response = json.dumps(response.json(), indent=2)
-    logger.debug(tidy_json_str_response)
+    # lazy so the body is only decoded and indented when the debug level is enabled
+    logger.opt(lazy=True).debug(
+        "{}",
+        lambda response=response: orjson.dumps(
+            parse_json(response), option=orjson.OPT_INDENT_2
+        ).decode(),
+    )
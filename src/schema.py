@@ -13,7 +13,7 @@ from __future__ import annotations
 
 from typing import List, Optional, Union
 
-from pydantic import BaseModel, RootModel
+from pydantic import BaseModel, RootModel, TypeAdapter
 
 
 class Bloody(BaseModel):
@@ -42,3 +42,8 @@ class GdayBody(BaseModel):
 
 class GdayBodyList(RootModel):
     root: List[GdayBody]
+
+
+# built once at import so repeated validation reuses the compiled core validator
+# without the RootModel wrapping of GdayBodyList
+GdayBodyAdapter: TypeAdapter[List[GdayBody]] = TypeAdapter(List[GdayBody])
@@ -1,4 +1,5 @@
 import pytest
+from pydantic import ValidationError
 from src.client import ApiClient
 
 
@@ -34,3 +35,69 @@ def test_api_client_initialization(base_url, verify, timeout, raise_on_error):
     assert client.verify == verify
     assert client.timeout == timeout
     assert client.raise_on_error == raise_on_error
+
+
+def test_api_client_context_manager():
+    """
+    Test leaving the with block closes the shared AsyncClient.
+    """
+    with ApiClient(base_url="https://api.example.com") as client:
+        client.http_client.client_requests([])
+        shared_client = client.http_client._client
+
+    assert shared_client is not None
+    assert shared_client.is_closed
+    assert client.http_client._client is None
+    assert client.http_client._loop_thread is None
+
+
+def test_api_client_pool_config():
+    """
+    Test connection pool and concurrency settings are threaded to the shared client.
+    """
+    client = ApiClient(
+        base_url="https://api.example.com",
+        max_connections=500,
+        max_keepalive_connections=50,
+        concurrency=500,
+        http2=False,
+    )
+
+    assert client.http_client.http2 is False
+    assert client.http_client.max_connections == 500
+    assert client.http_client.max_keepalive_connections == 50
+    assert client.http_client.concurrency == 500
+    assert "max_connections=500" in repr(client)
+    assert "http2_only=False" in repr(client)
+
+
+@pytest.mark.trio
+async def test_api_client_async_context_manager():
+    """
+    Test aget_anything runs on the caller's loop and async with closes its client.
+    """
+    async with ApiClient(base_url="https://api.example.com") as client:
+        assert await client.aget_anything([]) == []
+        shared_client = client.http_client._aclient
+
+    assert shared_client is not None
+    assert shared_client.is_closed
+    assert client.http_client._loop_thread is None
+
+
+def test_anything_request_info():
+    """
+    Test /anything bodies are validated and mapped to one GET request each.
+    """
+    bodies = [
+        {"gday": {"mate": {"how": {"the": {"bloody": {"hell": ["are", "ya", i]}}}}}}
+        for i in range(3)
+    ]
+    request_info = ApiClient._anything_request_info(bodies)
+
+    assert len(request_info) == 3
+    assert all(
+        info.method == "GET" and info.path == "anything" for info in request_info
+    )
+    with pytest.raises(ValidationError):
+        ApiClient._anything_request_info([{"gday": {"mate": None}}])
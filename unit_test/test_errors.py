@@ -0,0 +1,29 @@
+import pytest
+from httpx import HTTPStatusError, Request, Response
+
+from src.errors import ApiError
+
+
+@pytest.mark.parametrize(
+    "content, expected_errors",
+    [
+        (b'{"errors": ["bad id"]}', ["bad id"]),
+        (b'{"detail": "missing"}', {"detail": "missing"}),
+        (b'["bad id"]', ["bad id"]),
+        (b"Not Found", "Not Found"),
+        (b"\xff\xfe", "��"),
+    ],
+    ids=["errors_key", "json_object", "json_list", "utf8_text", "invalid_utf8"],
+)
+def test_api_error_parses_body(content, expected_errors):
+    """Test the error body is parsed once as JSON or falls back to text"""
+    response = Response(
+        404, content=content, request=Request("GET", "http://test.com/path")
+    )
+    error = ApiError(response)
+
+    assert isinstance(error, HTTPStatusError)
+    assert str(error) == "HTTP 404 Not Found for GET http://test.com/path"
+    assert error.status_code == 404
+    assert error.errors == expected_errors
+    assert error.response is response
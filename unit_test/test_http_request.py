@@ -1,11 +1,27 @@
+import asyncio
+from dataclasses import FrozenInstanceError
 from unittest.mock import AsyncMock, MagicMock
 
+import anyio
+import orjson
 import pytest
+import sniffio
+import trio
+from httpx import AsyncClient
 from httpx import Response
 from httpx import Limits
+from httpx import MockTransport
 from httpx import Request
 
-from src.http_requests import AsyncHandler, RequestInfo
+from src.errors import ApiError
+from src.http_requests import (
+    AsyncHandler,
+    RequestInfo,
+    Requests,
+    _HAS_UVLOOP,
+    _unwrap_single_error,
+    parse_json,
+)
 
 
 @pytest.mark.parametrize(
@@ -44,6 +60,10 @@ def test_request_info_methods(
     assert request_info.path == path
     assert request_info.body == expected_body
     assert request_info.params == expected_params
+    if expected_body is None:
+        assert request_info.content is None
+    else:
+        assert request_info.content == orjson.dumps(expected_body)
 
 
 def test_request_info_repr():
@@ -55,6 +75,22 @@ def test_request_info_repr():
     assert repr(request_info) == expected_repr
 
 
+def test_request_info_frozen():
+    """Test RequestInfo can't be changed after the computed fields are set"""
+    request_info = RequestInfo("post", "/path", body={"key": "value"})
+    assert request_info.content == b'{"key":"value"}'
+    assert request_info.dedup_key is None
+    with pytest.raises(FrozenInstanceError):
+        request_info.body = {"key": "other"}
+    assert not hasattr(request_info, "__dict__")
+
+
+def test_request_info_non_str_keys():
+    """Test bodies with non string keys are serialized like json.dumps would"""
+    request_info = RequestInfo("POST", "/path", body={1: "one", "key": {2: "two"}})
+    assert request_info.content == b'{"1":"one","key":{"2":"two"}}'
+
+
 async def mock_async_client(*args, **kwargs):
     """Mock the AsyncClient and its methods"""
     mock = AsyncMock()
@@ -78,6 +114,8 @@ def test_async_handler_init():
     assert handler.timeout == 15
     assert handler.verify is False
     assert handler.raise_on_error is True
+    assert handler.limits == Limits(max_connections=200, max_keepalive_connections=20)
+    assert handler.concurrency == 200
 
 
 @pytest.mark.trio
@@ -99,16 +137,559 @@ async def test_async_handler_context_manager():
     ],
 )
 async def test_make_request(method, path, body, expected_status):
+    """Test the GET/DELETE and POST/PUT/PATCH helpers store their response"""
     # Initialize AsyncHandler with mock client
     handler = AsyncHandler(base_url="http://test.com")
     handler.client = await mock_async_client()
+    responses = [None]
 
     # Get the appropriate method from the mock client
     method_func = getattr(handler.client, method.lower())
 
-    # Call make_request with the method, path, and body
-    await handler.make_request(method_func, path, body=body)
+    # Call the request helper for the method with the path, and body
+    limit = trio.CapacityLimiter(1)
+    if method in ("GET", "DELETE"):
+        await handler._get_delete(limit, responses, method_func, path, idx=0)
+    else:
+        content = orjson.dumps(body)
+        await handler._post_put_patch(
+            limit, responses, method_func, path, content=content, idx=0
+        )
+
+    # Assert that the response was stored in the batch's responses list
+    assert len(responses) == 1
+    assert responses[0].status_code == expected_status
+
+
+@pytest.mark.trio
+@pytest.mark.parametrize(
+    "client_headers, expected_content_type",
+    [
+        (None, "application/json"),
+        (
+            {"Content-Type": "application/merge-patch+json"},
+            "application/merge-patch+json",
+        ),
+    ],
+    ids=["default_json", "client_content_type"],
+)
+async def test_send_requests_content_type(client_headers, expected_content_type):
+    """Test bodies are sent as JSON unless the client sets its own Content-Type"""
+    sent = []
+
+    def transport(request):
+        sent.append(request)
+        return Response(200)
+
+    handler = AsyncHandler(base_url="http://test.com")
+    async with AsyncClient(
+        base_url="http://test.com",
+        headers=client_headers,
+        transport=MockTransport(transport),
+    ) as client:
+        await handler.send_requests(
+            [RequestInfo("PATCH", "/path", body={"key": "value"})], client
+        )
+
+    assert sent[0].headers["content-type"] == expected_content_type
+    assert sent[0].content == b'{"key":"value"}'
+
+
+@pytest.mark.trio
+async def test_requests_shared_client():
+    """Test the async AsyncClient is constructed once and released by aclose"""
+    requests = Requests(base_url="http://test.com")
+    assert await requests.aclient_requests([]) == []
+    client = requests._aclient
+    assert requests._get_aclient() is client
+
+    await requests.aclose()
+    assert client.is_closed
+    assert requests._aclient is None
+
+
+def test_requests_aclient_rebuilt_per_loop():
+    """Test a second event loop gets its own AsyncClient instead of the stale one"""
+    requests = Requests(base_url="http://test.com")
+
+    async def batch():
+        assert await requests.aclient_requests([]) == []
+        return requests._aclient
+
+    first = anyio.run(batch)
+    second = anyio.run(batch, backend="trio")
+
+    assert second is not first
+    assert requests._aclient is second
+
+
+def test_requests_aclose_per_loop_releases_pool():
+    """Test closing before each loop exits releases that loop's pooled connections"""
+    sent = []
+
+    def transport(request):
+        sent.append(request)
+        return Response(200)
+
+    requests = Requests(base_url="http://test.com")
+    requests._build_client = lambda: AsyncClient(
+        base_url="http://test.com", transport=MockTransport(transport)
+    )
+
+    async def batch():
+        try:
+            await requests.aclient_requests([RequestInfo("GET", "/path")])
+            return requests._aclient
+        finally:
+            await requests.aclose()
+
+    first = anyio.run(batch)
+    second = anyio.run(batch, backend="trio")
+
+    assert len(sent) == 2
+    assert first is not second
+    assert first.is_closed and second.is_closed
+    assert requests._aclient is None
+
+
+def test_request_info_normalises_method():
+    """Test lower case methods are upper cased and still drop the body"""
+    request_info = RequestInfo("get", "/path", body="body content")
+    assert request_info.method == "GET"
+    assert request_info.body is None
+
+
+@pytest.mark.trio
+async def test_send_requests_unsupported_method():
+    """Test an unknown method raises instead of silently falling back"""
+    handler = AsyncHandler(base_url="http://test.com")
+    client = await mock_async_client()
+    with pytest.raises(ValueError, match="Unsupported HTTP method 'TRACE'"):
+        await handler.send_requests([RequestInfo("TRACE", "/path")], client)
+
+
+@pytest.mark.trio
+async def test_send_requests_preserves_order():
+    """Test responses follow request order even when they complete out of order"""
+    handler = AsyncHandler(base_url="http://test.com")
+    client = await mock_async_client()
+
+    async def get(path, params=None):
+        # earlier requests finish last
+        await trio.sleep(0.01 * (3 - int(path)))
+        return Response(
+            200, content=path.encode(), request=Request("GET", "http://test.com")
+        )
+
+    client.get = get
+    requests = [RequestInfo("GET", str(i)) for i in range(3)]
+    responses = await handler.send_requests(requests, client)
+
+    assert [response.content for response in responses] == [b"0", b"1", b"2"]
+
+
+def test_requests_background_loop():
+    """Test batches share one loop thread and client until close"""
+    requests = Requests(base_url="http://test.com")
+    assert requests.client_requests([]) == []
+    loop_thread = requests._loop_thread
+    shared_client = requests._client
+
+    requests.client_requests([])
+    assert requests._loop_thread is loop_thread
+    assert requests._client is shared_client
+
+    requests.close()
+    assert not loop_thread.is_alive()
+    assert shared_client.is_closed
+    assert requests._loop_thread is None
+
+
+@pytest.mark.trio
+async def test_send_requests_coalesces_duplicates():
+    """Test identical GET requests are sent once and share the response"""
+    handler = AsyncHandler(base_url="http://test.com")
+    client = await mock_async_client()
+    requests = [
+        RequestInfo("GET", "/path", params={"a": 1, "b": 2}),
+        RequestInfo("GET", "/path", params={"a": 1}),
+        RequestInfo("GET", "/path", params={"b": 2, "a": 1}),
+        RequestInfo("GET", "/other", params="a=1&b=2"),
+        RequestInfo("GET", "/other", params="a=1&b=2"),
+    ]
+    responses = await handler.send_requests(requests, client)
+
+    assert client.get.await_count == 3
+    assert responses[2] is responses[0]
+    assert responses[4] is responses[3]
+
+
+@pytest.mark.trio
+async def test_send_requests_sends_repeated_posts():
+    """Test identical requests that change server state are all sent"""
+    handler = AsyncHandler(base_url="http://test.com")
+    client = await mock_async_client()
+    requests = [RequestInfo("POST", "/path", body={"key": "value"})] * 4 + [
+        RequestInfo("DELETE", "/path")
+    ] * 4
+    await handler.send_requests(requests, client)
+
+    assert client.post.await_count == 4
+    assert client.delete.await_count == 4
+
+
+def test_group_duplicates_skips_small_batches():
+    """Test batches below the threshold are not grouped"""
+    requests = [RequestInfo("GET", "/path")] * 3
+    assert AsyncHandler.group_duplicates(requests) == {0: [], 1: [], 2: []}
+
+
+@pytest.mark.trio
+async def test_iter_responses_streams_as_completed():
+    """Test responses are yielded in completion order"""
+    handler = AsyncHandler(base_url="http://test.com")
+    client = await mock_async_client()
+
+    async def get(path, params=None):
+        # earlier requests finish last
+        await trio.sleep(0.01 * (3 - int(path)))
+        return Response(
+            200, content=path.encode(), request=Request("GET", "http://test.com")
+        )
+
+    client.get = get
+    requests = [RequestInfo("GET", str(i)) for i in range(3)]
+    async with handler.iter_responses(requests, client) as responses:
+        streamed = [(idx, response.content) async for idx, response in responses]
+
+    assert streamed == [(2, b"2"), (1, b"1"), (0, b"0")]
+
+
+@pytest.mark.trio
+async def test_iter_responses_streams_duplicates():
+    """Test every position of a coalesced request is yielded"""
+    handler = AsyncHandler(base_url="http://test.com")
+    client = await mock_async_client()
+    requests = [RequestInfo("GET", "/path")] * 4
+    async with handler.iter_responses(requests, client) as responses:
+        streamed = [idx async for idx, _ in responses]
+
+    assert sorted(streamed) == [0, 1, 2, 3]
+    assert client.get.await_count == 1
+
+
+@pytest.mark.trio
+async def test_iter_responses_backpressure():
+    """Test a consumer that stops reading stops new requests from starting"""
+    handler = AsyncHandler(base_url="http://test.com", max_connections=3, http2=False)
+    client = await mock_async_client()
+    requests = [RequestInfo("GET", str(i)) for i in range(40)]
+    async with handler.iter_responses(requests, client) as responses:
+        await responses.receive()
+        await trio.sleep(0.01)
+        # the window of 4 tasks per limiter token plus the slot freed by receive
+        assert client.get.await_count <= 9
+        streamed = [idx async for idx, _ in responses]
+
+    assert len(streamed) == 39
+    assert client.get.await_count == 40
+
+
+async def slow_get(path, params=None):
+    """Mocked client.get that yields to the loop like a real transport would"""
+    await anyio.sleep(0.001)
+    return Response(200, request=Request("GET", "http://test.com"))
+
+
+@pytest.mark.anyio
+async def test_iter_responses_break_early(anyio_backend):
+    """Test leaving the block after the first response cancels the rest cleanly"""
+    handler = AsyncHandler(base_url="http://test.com")
+    client = await mock_async_client()
+    client.get = slow_get
+    requests = [RequestInfo("GET", str(i)) for i in range(20)]
+
+    async with handler.iter_responses(requests, client) as responses:
+        async for idx, response in responses:
+            break
+
+    assert response.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_iter_responses_consumer_raises(anyio_backend):
+    """Test an error raised by the consumer reaches the caller unchanged"""
+    handler = AsyncHandler(base_url="http://test.com")
+    client = await mock_async_client()
+    client.get = slow_get
+    requests = [RequestInfo("GET", str(i)) for i in range(20)]
+
+    with pytest.raises(KeyError):
+        async with handler.iter_responses(requests, client) as responses:
+            async for _ in responses:
+                raise KeyError("consumer")
+
+
+@pytest.mark.trio
+async def test_requests_astream_requests_empty():
+    """Test an empty batch closes the stream straight away"""
+    requests = Requests(base_url="http://test.com")
+    async with requests.astream_requests([]) as responses:
+        assert [item async for item in responses] == []
+    await requests.aclose()
+
+
+@pytest.mark.parametrize(
+    "max_connections, concurrency, http2, http2_only, expected_tokens",
+    [
+        (200, 200, False, False, 199),
+        (200, 50, False, False, 50),
+        (1, 10, False, False, 1),
+        (200, 200, True, False, 199),
+        (1, 10, True, True, 10),
+        (1, 500, False, True, 100),
+    ],
+    ids=[
+        "capped_below_pool",
+        "under_pool",
+        "single_connection",
+        "http2_may_fall_back",
+        "http2_only_multiplexed",
+        "http2_only_capped_by_streams",
+    ],
+)
+def test_async_handler_limit_tokens(
+    max_connections, concurrency, http2, http2_only, expected_tokens
+):
+    """Test the limiter stays below what the connection pool can carry"""
+    handler = AsyncHandler(
+        base_url="http://test.com",
+        max_connections=max_connections,
+        concurrency=concurrency,
+        http2=http2,
+        http2_only=http2_only,
+    )
+    assert handler.limit_tokens == expected_tokens
+    assert handler.http2 is (http2 or http2_only)
+
+
+@pytest.mark.trio
+async def test_send_requests_bounds_in_flight():
+    """Test in flight requests never exceed the limiter while the window refills"""
+    handler = AsyncHandler(base_url="http://test.com", max_connections=3, http2=False)
+    client = await mock_async_client()
+    in_flight = 0
+    peak = 0
+
+    async def get(path, params=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await trio.sleep(0.001)
+        in_flight -= 1
+        return Response(200, request=Request("GET", "http://test.com"))
+
+    client.get = get
+    requests = [RequestInfo("GET", str(i)) for i in range(40)]
+    responses = await handler.send_requests(requests, client)
+
+    assert peak == 2
+    assert all(response.status_code == 200 for response in responses)
+
+
+@pytest.mark.trio
+async def test_send_requests_window_per_batch():
+    """Test concurrent batches on one handler each keep their own pending task bound"""
+    handler = AsyncHandler(base_url="http://test.com", max_connections=3, http2=False)
+    client = await mock_async_client()
+    get_delete = handler._get_delete
+    pending = 0
+    peak = 0
+
+    async def tracked(*args):
+        nonlocal pending, peak
+        pending += 1
+        peak = max(peak, pending)
+        try:
+            await get_delete(*args)
+        finally:
+            pending -= 1
+
+    async def get(path, params=None):
+        await trio.sleep(0.005)
+        return Response(200, request=Request("GET", "http://test.com"))
+
+    handler._get_delete = tracked
+    client.get = get
+    requests = [RequestInfo("GET", str(i)) for i in range(40)]
+
+    async def staggered():
+        # start once the first batch's opening tasks are in flight
+        await trio.sleep(0.002)
+        await handler.send_requests(requests, client)
+
+    with trio.fail_after(5):
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(handler.send_requests, requests, client)
+            nursery.start_soon(staggered)
+
+    # two batches of 2 limiter tokens, each allowed 4 pending tasks per token
+    assert peak <= 16
+
+
+@pytest.mark.trio
+async def test_request_raises_api_error():
+    """Test error responses raise ApiError when raise_on_error is set"""
+    handler = AsyncHandler(base_url="http://test.com")
+    client = await mock_async_client()
+    client.get = AsyncMock(
+        return_value=Response(
+            404, content=b"Not Found", request=Request("GET", "http://test.com/path")
+        )
+    )
+
+    with pytest.raises(ApiError) as err:
+        await handler._get_delete(trio.CapacityLimiter(1), [None], client.get, "/path")
+    assert err.value.errors == "Not Found"
+
+
+@pytest.mark.trio
+async def test_request_releases_window():
+    """Test the helper frees its window slot even when the request fails"""
+    handler = AsyncHandler(base_url="http://test.com")
+    get = AsyncMock(
+        return_value=Response(404, request=Request("GET", "http://test.com/path"))
+    )
+    window = anyio.Semaphore(1)
+    await window.acquire()
+
+    with pytest.raises(ApiError):
+        await handler._get_delete(
+            trio.CapacityLimiter(1), [None], get, "/path", window=window
+        )
+    assert window.value == 1
+
+
+def test_parse_json():
+    """Test orjson decoding matches response.json()"""
+    response = Response(200, content=b'{"gday": {"mate": [1, "two", null]}}')
+    assert parse_json(response) == response.json()
+
+
+@pytest.mark.parametrize("backend", ["asyncio", "trio"])
+def test_requests_background_loop_backend(backend):
+    """Test the background loop runs on the chosen backend, uvloop when installed"""
+
+    async def running_loop():
+        loop = asyncio.get_running_loop() if backend == "asyncio" else None
+        return sniffio.current_async_library(), loop
+
+    requests = Requests(base_url="http://test.com", backend=backend)
+    assert requests.client_requests([]) == []
+    library, loop = requests._portal.call(running_loop)
+    requests.close()
+
+    assert library == backend
+    if backend == "asyncio" and _HAS_UVLOOP:
+        import uvloop
+
+        assert isinstance(loop, uvloop.Loop)
+
+
+def test_requests_rejects_unknown_backend():
+    """Test an unsupported backend fails on construction, not in the loop thread"""
+    with pytest.raises(ValueError, match="Unsupported backend 'Trio'"):
+        Requests(base_url="http://test.com", backend="Trio")
+
+
+def test_requests_background_loop_startup_error():
+    """Test a loop that fails to start raises in the caller instead of hanging"""
+    requests = Requests(base_url="http://test.com", backend="trio")
+    requests._backend_options = lambda: {"not_a_trio_option": True}
+
+    with pytest.raises(TypeError):
+        requests.client_requests([])
+    assert requests._loop_thread is None
+
+
+@pytest.mark.anyio
+async def test_send_requests_raises_api_error(anyio_backend):
+    """Test a failed request raises ApiError on each backend, not an exception group"""
+    handler = AsyncHandler(base_url="http://test.com")
+    client = await mock_async_client()
+    client.get = AsyncMock(
+        return_value=Response(
+            404, content=b"Not Found", request=Request("GET", "http://test.com/path")
+        )
+    )
+    requests = [RequestInfo("GET", "/path"), RequestInfo("POST", "/path", body=[1])]
+
+    with pytest.raises(ApiError):
+        await handler.send_requests(requests, client)
+
+
+@pytest.mark.anyio
+async def test_send_requests_raises_first_of_many_api_errors(anyio_backend):
+    """Test several failed requests still raise a single ApiError on each backend"""
+    handler = AsyncHandler(base_url="http://test.com")
+    client = await mock_async_client()
+    client.get = AsyncMock(
+        return_value=Response(
+            404, content=b"Not Found", request=Request("GET", "http://test.com/path")
+        )
+    )
+    requests = [RequestInfo("GET", str(i)) for i in range(10)]
+
+    with pytest.raises(ApiError) as err:
+        await handler.send_requests(requests, client)
+    assert err.value.status_code == 404
+
+
+def test_unwrap_single_error_keeps_mixed_groups():
+    """Test only groups made up entirely of ApiError are unwrapped"""
+    response = Response(404, request=Request("GET", "http://test.com/path"))
+    first = ApiError(response)
+
+    with pytest.raises(ApiError) as err:
+        with _unwrap_single_error():
+            raise ExceptionGroup("", [first, ExceptionGroup("", [ApiError(response)])])
+    assert err.value is first
+
+    with pytest.raises(ExceptionGroup):
+        with _unwrap_single_error():
+            raise ExceptionGroup("", [first, ValueError("not an api error")])
+
+
+@pytest.mark.trio
+@pytest.mark.parametrize(
+    "status_code, raise_on_error, raises",
+    [(200, True, False), (302, True, True), (500, True, True), (500, False, False)],
+    ids=["ok", "redirect", "server_error", "server_error_not_raised"],
+)
+async def test_request_status_check(status_code, raise_on_error, raises):
+    """Test any status outside the 200 range raises only when raise_on_error is set"""
+    handler = AsyncHandler(base_url="http://test.com", raise_on_error=raise_on_error)
+    responses = [None]
+    response = Response(status_code, request=Request("GET", "http://test.com/path"))
+    get = AsyncMock(return_value=response)
+
+    if raises:
+        with pytest.raises(ApiError):
+            await handler._get_delete(trio.CapacityLimiter(1), responses, get, "/path")
+    else:
+        await handler._get_delete(trio.CapacityLimiter(1), responses, get, "/path")
+        assert responses[0] is response
+
+
+@pytest.mark.trio
+async def test_send_requests_fresh_responses_per_call():
+    """Test a reused handler returns only the current batch's responses"""
+    handler = AsyncHandler(base_url="http://test.com")
+    client = await mock_async_client()
+
+    first = await handler.send_requests([RequestInfo("GET", "/path")] * 2, client)
+    second = await handler.send_requests([RequestInfo("POST", "/path")], client)
 
-    # Assert that the response was added to the handler's responses list
-    assert len(handler.responses) == 1
-    assert handler.responses[0].status_code == expected_status
+    assert len(first) == 2
+    assert [response.status_code for response in second] == [201]
+    assert not hasattr(handler, "responses")
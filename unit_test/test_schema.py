@@ -6,7 +6,7 @@ import pytest
 
 import pytest
 from pydantic import ValidationError
-from src.schema import GdayBodyList
+from src.schema import GdayBodyAdapter, GdayBodyList
 
 
 # Parametrized test data with custom identifiers as inputs
@@ -56,7 +56,10 @@ def test_gday_body_list_validation(json_data, expected_success):
         # Test successful validation
         gday_body_list = GdayBodyList(root=json_data)
         assert isinstance(gday_body_list, GdayBodyList)
+        assert GdayBodyAdapter.validate_python(json_data) == gday_body_list.root
     else:
         # Test unsuccessful validation (expecting a ValidationError)
         with pytest.raises(ValidationError):
             GdayBodyList(root=json_data)
+        with pytest.raises(ValidationError):
+            GdayBodyAdapter.validate_python(json_data)